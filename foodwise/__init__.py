@@ -0,0 +1 @@
+# foodwise - FoodWise app modules (imported once per process by app.py)
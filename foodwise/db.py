@@ -0,0 +1,135 @@
+# foodwise/db.py - SQLite-backed orders store
+import os
+import sqlite3
+from datetime import datetime
+
+import streamlit as st
+
+from foodwise.metrics import track_db, count_query
+
+DB_PATH = "orders.db"
+
+def get_conn():
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.set_trace_callback(count_query)
+    return conn
+
+@track_db
+def init_db():
+    conn = get_conn()
+    c = conn.cursor()
+    # Create table with columns for NGO info as well
+    c.execute("""
+    CREATE TABLE IF NOT EXISTS orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        restaurant TEXT,
+        username TEXT,
+        item TEXT,
+        qty TEXT,
+        pickup TEXT,
+        location TEXT,
+        contact TEXT,
+        notes TEXT,
+        price TEXT,
+        status TEXT,
+        posted_on TEXT,
+        confirmed_by TEXT,
+        confirmed_on TEXT,
+        ngo_contact TEXT,
+        ngo_location TEXT
+    )
+    """)
+    conn.commit()
+
+    # Ensure extra columns exist (migration-friendly)
+    c.execute("PRAGMA table_info(orders)")
+    cols = [r[1] for r in c.fetchall()]
+    needed = {
+        "confirmed_by": "TEXT",
+        "confirmed_on": "TEXT",
+        "ngo_contact": "TEXT",
+        "ngo_location": "TEXT"
+    }
+    for col, coltype in needed.items():
+        if col not in cols:
+            # add missing column
+            c.execute(f"ALTER TABLE orders ADD COLUMN {col} {coltype}")
+    conn.commit()
+    conn.close()
+
+@track_db
+def insert_order(order):
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute("""
+        INSERT INTO orders (restaurant, username, item, qty, pickup, location, contact, notes, price, status, posted_on)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        order["restaurant"], order["username"], order["item"], order["qty"], order["pickup"],
+        order["location"], order["contact"], order["notes"], order["price"], order["status"], order["posted_on"]
+    ))
+    conn.commit()
+    rowcount = c.rowcount
+    conn.close()
+    return rowcount
+
+@track_db
+def fetch_orders(filter_clause=None, params=()):
+    conn = get_conn()
+    c = conn.cursor()
+    q = "SELECT * FROM orders"
+    if filter_clause:
+        q += f" WHERE {filter_clause}"
+    q += " ORDER BY id DESC"
+    c.execute(q, params)
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+@track_db
+def update_order_status(order_id, new_status, confirmed_by=None, ngo_contact=None, ngo_location=None):
+    conn = get_conn()
+    c = conn.cursor()
+    if confirmed_by or ngo_contact or ngo_location:
+        c.execute("""
+            UPDATE orders
+            SET status=?, confirmed_by=?, confirmed_on=?, ngo_contact=?, ngo_location=?
+            WHERE id=?
+        """, (new_status, confirmed_by or "", datetime.now().strftime("%Y-%m-%d %H:%M:%S"), ngo_contact or "", ngo_location or "", order_id))
+    else:
+        c.execute("UPDATE orders SET status=? WHERE id=?", (new_status, order_id))
+    conn.commit()
+    rowcount = c.rowcount
+    conn.close()
+    return rowcount
+
+@track_db
+def remove_order(order_id):
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute("DELETE FROM orders WHERE id=?", (order_id,))
+    conn.commit()
+    rowcount = c.rowcount
+    conn.close()
+    return rowcount
+
+
+@st.cache_resource
+def _init_db_once(db_file):
+    init_db()
+    return DB_PATH
+
+def _db_file():
+    try:
+        st_db = os.stat(DB_PATH)
+    except FileNotFoundError:
+        return None
+    return (st_db.st_dev, st_db.st_ino)
+
+def ensure_db():
+    # schema creation/migration only needs to happen once per database file, not on every rerun.
+    # Keying the cache on the file's identity means a deleted or replaced orders.db (a common
+    # demo reset) is re-initialised on the next rerun instead of failing with "no such table".
+    if _db_file() is None:
+        init_db()
+    return _init_db_once(_db_file())
@@ -0,0 +1,108 @@
+# foodwise/layout.py - session seeding, styles, header/footer and the admin panel
+import os
+
+import streamlit as st
+
+from foodwise.metrics import METRICS_PATH, arm_profiler
+
+# ---------------------- SESSION / IN-MEMORY USERS ----------------------
+@st.cache_resource
+def admin_password():
+    """Admin password from FOODWISE_ADMIN_PASSWORD or st.secrets["admin_password"]; None disables the admin role.
+
+    Resolved once per process: a missing secrets.toml is re-scanned on every st.secrets access.
+    """
+    password = os.environ.get("FOODWISE_ADMIN_PASSWORD")
+    if password:
+        return password
+    try:
+        return st.secrets.get("admin_password") or None
+    except Exception:
+        # no secrets.toml configured
+        return None
+
+def seed_session_state():
+    if 'users' not in st.session_state:
+        st.session_state.users = {
+            # demo users: username -> {password, role, display, contact, location}
+            "restro1": {"password": "restro123", "role": "restaurant", "display": "Restro One", "contact": "9876500000", "location": "Campus Block A"},
+            "restro2": {"password": "restro234", "role": "restaurant", "display": "Tasty Corner", "contact": "9876501111", "location": "Block B"},
+            "ngo1": {"password": "ngo123", "role": "ngo", "display": "Helping NGO", "contact": "9998800000", "location": "NGO Center"},
+            "ngo2": {"password": "ngo234", "role": "ngo", "display": "Care Foundation", "contact": "9998801111", "location": "Welfare Hub"},
+        }
+        if admin_password():
+            st.session_state.users["admin"] = {"password": admin_password(), "role": "admin", "display": "Site Admin", "contact": "", "location": ""}
+
+    if 'current_user' not in st.session_state:
+        st.session_state.current_user = None
+    if 'current_role' not in st.session_state:
+        st.session_state.current_role = None
+    if 'msg_flag' not in st.session_state:
+        st.session_state.msg_flag = None
+    if 'favorite_recipes' not in st.session_state:
+        st.session_state.favorite_recipes = []
+    if 'shared_items' not in st.session_state:
+        st.session_state.shared_items = []
+    if 'waste_log' not in st.session_state:
+        st.session_state.waste_log = []
+    if 'meal_plan' not in st.session_state:
+        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+        meals = ["Breakfast", "Lunch", "Dinner"]
+        st.session_state.meal_plan = {day: {meal: "" for meal in meals} for day in days}
+
+
+# ---------------------- STYLES & HEADER ----------------------
+STYLES = """
+    <style>
+    .foodwise-hero h1 { color:#FF6F61; font-size:2.4rem; margin-bottom:0; }
+    .foodwise-hero h3 { color:#22C55E; font-weight:600; margin-top:0.15rem; }
+    .stButton>button { background:#FF6F61; color:white; border-radius:10px; padding:0.45rem 0.8rem; border:0; }
+    .recipe-card { border:1px solid #E2E8F0; border-radius:10px; padding:0.8rem; margin-bottom:0.9rem; }
+    </style>
+"""
+
+HEADER = ('<div class="foodwise-hero" style="text-align:center; padding:8px 0 12px 0;">'
+          '<h1>🍲 FoodWise</h1>'
+          '<h3>Leftovers → Recipes · Planner · Sharing · Restaurant ↔ NGO</h3>'
+          '</div>')
+
+def render_header():
+    st.markdown(STYLES, unsafe_allow_html=True)
+    st.markdown(HEADER, unsafe_allow_html=True)
+
+# ---------------------- SHOW LOGIN STATE & FOOTER ----------------------
+def render_footer():
+    st.markdown("---")
+    if st.session_state.current_user:
+        display = st.session_state.users.get(st.session_state.current_user, {}).get("display", st.session_state.current_user)
+        st.write(f"Logged in as {display} · role: {st.session_state.current_role}")
+    else:
+        st.write("Not logged in.")
+
+    st.markdown("<div style='text-align:center; color:#666; padding:8px 0;'>FoodWise ♻ · Orders persisted to SQLite (orders.db). Host on a server to share between devices.</div>", unsafe_allow_html=True)
+
+# ---------------------- ADMIN: PERFORMANCE PANEL ----------------------
+def render_admin_panel(run_metrics, metrics_error=None, profiled=False):
+    with st.sidebar:
+        st.header("⚙️ Performance (last rerun)")
+        m1, m2 = st.columns(2)
+        m1.metric("Rerun time", f"{run_metrics['rerun_seconds'] * 1000:.1f} ms")
+        m2.metric("DB queries", run_metrics["queries"])
+        st.caption(f"First rerun in this process: {run_metrics['first_rerun_seconds'] * 1000:.0f} ms")
+        st.markdown("**Sections**")
+        st.table([{"Section": k, "ms": round(v["seconds"] * 1000, 2), "Calls": v["calls"]}
+                  for k, v in sorted(run_metrics["sections"].items(), key=lambda kv: -kv[1]["seconds"])])
+        st.markdown("**Data layer**")
+        if run_metrics["db"]:
+            st.table([{"Call": k, "ms": round(v["seconds"] * 1000, 2), "Calls": v["calls"], "Rows": v["rows"]}
+                      for k, v in sorted(run_metrics["db"].items(), key=lambda kv: -kv[1]["seconds"])])
+        else:
+            st.info("No database calls this rerun.")
+        if metrics_error:
+            st.warning(f"Could not write {METRICS_PATH}: {metrics_error}")
+        else:
+            st.caption(f"Process-wide totals written to {METRICS_PATH}")
+        st.button("🔬 Profile one rerun (cProfile)", key="btn_profile", on_click=arm_profiler)
+        if st.session_state.get("last_profile"):
+            with st.expander("Last cProfile capture", expanded=profiled):
+                st.code(st.session_state.last_profile)
@@ -0,0 +1,185 @@
+# foodwise/metrics.py - per-rerun timings, process-wide totals and Prometheus export
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+import streamlit as st
+
+METRICS_PATH = os.environ.get("FOODWISE_METRICS_PATH", "metrics.prom")
+
+# This module is imported once per process, but every rerun runs on its own script thread,
+# so the current rerun's numbers live in a thread-local rather than a module global.
+_local = threading.local()
+# first-rerun latency: from loading this package (during the first script run, after Python and
+# Streamlit have already started) to the end of that run; tests/test_startup.py covers cold imports
+_process = {"imported": time.perf_counter(), "first_rerun_seconds": None}
+
+# Process-wide totals behind metrics.prom. Sessions finish reruns concurrently, so these are
+# cumulative counters guarded by a lock; the per-rerun dict above only feeds the admin panel.
+RERUN_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_totals_lock = threading.Lock()
+_totals = {"reruns": 0, "queries": 0, "last_rerun_at": 0.0, "sections": {}, "db": {},
+           "rerun_buckets": [0] * len(RERUN_BUCKETS), "rerun_seconds_sum": 0.0}
+
+
+def new_run_metrics():
+    return {"started": time.perf_counter(), "sections": {}, "db": {}, "queries": 0}
+
+def current():
+    if not hasattr(_local, "metrics"):
+        _local.metrics = new_run_metrics()
+    return _local.metrics
+
+def begin_run():
+    _local.metrics = new_run_metrics()
+    return _local.metrics
+
+@contextmanager
+def timed(section):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry = current()["sections"].setdefault(section, {"seconds": 0.0, "calls": 0})
+        entry["seconds"] += time.perf_counter() - start
+        entry["calls"] += 1
+
+def track_db(func):
+    """Record wall time, call count and rows returned/affected for a data-layer helper."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            # failing calls (locked DB, bad filter) still count towards time and calls
+            entry = current()["db"].setdefault(func.__name__, {"seconds": 0.0, "calls": 0, "rows": 0})
+            entry["seconds"] += time.perf_counter() - start
+            entry["calls"] += 1
+            if isinstance(result, list):
+                entry["rows"] += len(result)
+            elif isinstance(result, int):
+                entry["rows"] += result
+    return wrapper
+
+def count_query(statement):
+    # sqlite3 trace callback; transaction control statements are not interesting here
+    if not statement.lstrip().upper().startswith(("BEGIN", "COMMIT", "ROLLBACK")):
+        current()["queries"] += 1
+
+def _prom_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def accumulate(metrics):
+    """Fold one finished rerun into the process-wide totals."""
+    with _totals_lock:
+        _totals["reruns"] += 1
+        _totals["queries"] += metrics["queries"]
+        _totals["last_rerun_at"] = metrics["finished_at"]
+        for name, v in metrics["sections"].items():
+            entry = _totals["sections"].setdefault(name, {"seconds": 0.0, "calls": 0})
+            entry["seconds"] += v["seconds"]
+            entry["calls"] += v["calls"]
+        for name, v in metrics["db"].items():
+            entry = _totals["db"].setdefault(name, {"seconds": 0.0, "calls": 0, "rows": 0})
+            entry["seconds"] += v["seconds"]
+            entry["calls"] += v["calls"]
+            entry["rows"] += v["rows"]
+        for i, bound in enumerate(RERUN_BUCKETS):
+            if metrics["rerun_seconds"] <= bound:
+                _totals["rerun_buckets"][i] += 1
+        _totals["rerun_seconds_sum"] += metrics["rerun_seconds"]
+
+def render_prometheus(totals, first_rerun_seconds=None):
+    """Render the process-wide totals in the Prometheus text exposition format."""
+    sections, db = totals["sections"], totals["db"]
+    families = [
+        ("foodwise_reruns_total", "counter", "Script reruns finished by this process.", [("", "", totals["reruns"])]),
+        ("foodwise_rerun_duration_seconds", "histogram", "Wall time of a script rerun.",
+         [("_bucket", f'le="{bound}"', count) for bound, count in zip(RERUN_BUCKETS, totals["rerun_buckets"])]
+         + [("_bucket", 'le="+Inf"', totals["reruns"]),
+            ("_sum", "", totals["rerun_seconds_sum"]),
+            ("_count", "", totals["reruns"])]),
+        ("foodwise_last_rerun_timestamp_seconds", "gauge", "Unix time at which the last rerun finished.",
+         [("", "", totals["last_rerun_at"])]),
+        ("foodwise_first_rerun_seconds", "gauge", "Time from loading the foodwise package to the end of the first rerun in this process.",
+         [("", "", first_rerun_seconds)] if first_rerun_seconds is not None else []),
+        ("foodwise_db_queries_total", "counter", "SQL statements executed.", [("", "", totals["queries"])]),
+        ("foodwise_section_seconds_total", "counter", "Wall time spent in an app section.",
+         [("", f'section="{_prom_label(k)}"', v["seconds"]) for k, v in sections.items()]),
+        ("foodwise_section_calls_total", "counter", "Times an app section was entered.",
+         [("", f'section="{_prom_label(k)}"', v["calls"]) for k, v in sections.items()]),
+        ("foodwise_db_call_seconds_total", "counter", "Wall time spent in a data-layer helper.",
+         [("", f'call="{_prom_label(k)}"', v["seconds"]) for k, v in db.items()]),
+        ("foodwise_db_calls_total", "counter", "Calls to a data-layer helper.",
+         [("", f'call="{_prom_label(k)}"', v["calls"]) for k, v in db.items()]),
+        ("foodwise_db_rows_total", "counter", "Rows returned or affected by a data-layer helper.",
+         [("", f'call="{_prom_label(k)}"', v["rows"]) for k, v in db.items()]),
+    ]
+    lines = []
+    for name, metric_type, help_text, samples in families:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{{{labels}}} {value}" if labels else f"{name}{suffix} {value}")
+    return "\n".join(lines) + "\n"
+
+def write_metrics_file(path=METRICS_PATH):
+    # write-then-rename so a scraper never reads a half-written file; the lock keeps a slower
+    # writer from replacing the file with an older snapshot of the totals
+    with _totals_lock:
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=os.path.dirname(path) or ".",
+                                         prefix=".metrics-", suffix=".tmp", delete=False) as f:
+            f.write(render_prometheus(_totals, _process["first_rerun_seconds"]))
+        try:
+            os.replace(f.name, path)
+        except OSError:
+            os.unlink(f.name)
+            raise
+
+# ---------------------- PROFILING ----------------------
+def arm_profiler():
+    # button callbacks run before the rerun they trigger, so that whole rerun gets profiled
+    st.session_state.profile_next_rerun = True
+
+def start_profiler():
+    if not st.session_state.get("profile_next_rerun"):
+        return None
+    import cProfile  # lazy: only loaded when an admin asks for a capture
+    st.session_state.profile_next_rerun = False
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+def stop_profiler(profiler):
+    import io
+    import pstats
+    profiler.disable()
+    buf = io.StringIO()
+    pstats.Stats(profiler, stream=buf).sort_stats("cumulative").print_stats(30)
+    st.session_state.last_profile = buf.getvalue()
+
+def finish_run(profiler=None):
+    """Close out the current rerun: stop profiling, add it to the totals and write the metrics file.
+
+    Returns a write error, if any.
+    """
+    metrics = current()
+    metrics["rerun_seconds"] = time.perf_counter() - metrics["started"]
+    metrics["finished_at"] = time.time()
+    if _process["first_rerun_seconds"] is None:
+        _process["first_rerun_seconds"] = time.perf_counter() - _process["imported"]
+    metrics["first_rerun_seconds"] = _process["first_rerun_seconds"]
+    if profiler is not None:
+        stop_profiler(profiler)
+    accumulate(metrics)
+    try:
+        write_metrics_file()
+    except OSError as e:
+        return str(e)
+    return None
@@ -0,0 +1,127 @@
+# foodwise/recipes.py - leftover recipe generator
+import random
+
+
+def build_recipe_title(main, style, dish_type):
+    return f"{style} {main} {dish_type}".replace("  ", " ").title()
+
+def generate_20_recipes(ingredients_list, diet_pref, max_time_limit, difficulty_pref):
+    """
+    Deterministic-ish generator that mixes the user's ingredients with sensible additions,
+    cooking methods, cuisines and dish types to produce 20 varied recipes.
+    """
+    # normalize and choose main ingredients
+    mains = ingredients_list[:] if ingredients_list else ["vegetables"]
+    # ensure at least 2 mains
+    if len(mains) < 2:
+        mains = mains + ["vegetables"] * (2 - len(mains))
+
+    cuisines = ["Indian-style", "Italian", "Chinese-style", "Mexican", "Mediterranean", "Thai", "Middle Eastern", "Fusion"]
+    methods = ["Stir-Fry", "Baked", "Roasted", "Grilled", "Pan-fried", "One-Pot", "Slow-cooked", "Sauteed", "Steamed"]
+    dish_types = ["Rice", "Wraps", "Curry", "Soup", "Salad", "Patties", "Casserole", "Bowl", "Skillet", "Pasta"]
+    extras = {
+        "Indian-style": ["garam masala", "turmeric", "cumin", "coriander", "green chilies"],
+        "Italian": ["olive oil", "basil", "parmesan", "oregano", "garlic"],
+        "Chinese-style": ["soy sauce", "ginger", "spring onions", "sesame oil"],
+        "Mexican": ["cilantro", "lime", "cumin", "chili powder"],
+        "Mediterranean": ["olive oil", "lemon", "feta", "olives"],
+        "Thai": ["lime", "fish sauce", "coconut milk", "chilies"],
+        "Middle Eastern": ["sumac", "tahini", "paprika", "parsley"],
+        "Fusion": ["mixed herbs", "soy sauce", "lemon"]
+    }
+
+    recipes = []
+    rng = random.Random(42)  # deterministic seed for reproducible outputs
+
+    # produce 20 recipes by combining patterns
+    for i in range(20):
+        main = rng.choice(mains)
+        cuisine = rng.choice(cuisines)
+        method = rng.choice(methods)
+        dish_type = rng.choice(dish_types)
+        additions = rng.sample(extras.get(cuisine, ["salt", "pepper"]), k=2)
+        # Build ingredient list
+        ingreds = [main]
+        # include a second ingredient if available
+        if len(ingredients_list) >= 2:
+            ingreds.append(ingredients_list[1])
+        # add sensible staples
+        staples = ["salt", "pepper", "oil", "water"]
+        # vary staples inclusion
+        staples_add = rng.sample(staples, k=2)
+        # combine
+        full_ingredients = ingreds + additions + staples_add
+        # filter diet preferences (basic filter)
+        if diet_pref == "Vegan":
+            # remove dairy-related words
+            full_ingredients = [it for it in full_ingredients if it.lower() not in ("yogurt", "parmesan", "feta", "butter", "milk")]
+        if diet_pref == "Vegetarian":
+            # keep as is (we're not adding meat)
+            pass
+        if diet_pref == "Gluten-free":
+            # avoid "tortillas", "pasta" mentions in description (we will adapt instructions)
+            pass
+
+        # time estimate logic
+        base_time = max(10, min(20 + i, max_time_limit + 10))
+        est_time = min(base_time, max_time_limit + 20)
+
+        # Difficulty heuristic
+        diff_map = {"Easy": ["Stir-Fry", "Salad", "Wraps", "Soup"], "Medium": ["Baked", "Casserole", "Pasta", "Skillet"], "Hard": ["Slow-cooked", "Roasted", "Grilled"]}
+        det_diff = difficulty_pref
+        # if method indicates higher complexity, bump difficulty sometimes
+        if method in diff_map["Hard"] and difficulty_pref == "Easy":
+            det_diff = "Medium"
+
+        title = build_recipe_title(main, cuisine, f"{method} {dish_type}")
+
+        # Build instructions (concise, practical)
+        instructions = []
+        instructions.append(f"1. Prepare: Chop {', '.join(set([main] + (ingredients_list[1:2] if len(ingredients_list)>1 else [])))} and gather {', '.join(additions)}.")
+        if "Stir-Fry" in method or "Pan-fried" in method or "Sauteed" in method:
+            instructions.append("2. Heat oil in a large pan or wok over high heat. Add aromatics (garlic/ginger) and stir briefly.")
+            instructions.append(f"3. Add main ingredients and {ingredients_list[1] if len(ingredients_list)>1 else 'vegetables'}. Stir-fry until cooked through.")
+            instructions.append("4. Add sauces/spices, toss, and serve hot.")
+        elif "Soup" in dish_type or "Steamed" in method:
+            instructions.append("2. In a pot, sauté aromatics, add broth/water and main ingredients.")
+            instructions.append("3. Simmer until flavors meld and vegetables are tender.")
+            instructions.append("4. Adjust seasoning and serve.")
+        elif "Baked" in method or "Roasted" in method or "Casserole" in dish_type:
+            instructions.append("2. Preheat oven to 180–200°C (350–400°F).")
+            instructions.append("3. Combine ingredients in a baking dish, add sauce or stock, cover if needed.")
+            instructions.append("4. Bake until golden and cooked through. Let rest, then serve.")
+        elif "Wraps" in dish_type:
+            instructions.append("2. Cook filling (stir-fry or roast), warm tortillas, assemble with sauce and greens.")
+            instructions.append("3. Roll tightly and slice to serve.")
+        elif "Pasta" in dish_type:
+            instructions.append("2. Boil pasta until al dente. In a pan, make a quick sauce with main ingredients.")
+            instructions.append("3. Toss pasta with sauce, add herbs/cheese if available, and serve.")
+        else:
+            instructions.append("2. Cook main ingredient with spices and any added vegetables until done.")
+            instructions.append("3. Finish with fresh herbs/acid (lemon/vinegar) and serve.")
+
+        # small tips
+        tips = []
+        if "soup" in title.lower():
+            tips.append("Tip: Blend part of the soup for a thicker texture.")
+        if "wrap" in title.lower():
+            tips.append("Tip: Add crunchy vegetables for texture.")
+        if "baked" in title.lower() or "casserole" in title.lower():
+            tips.append("Tip: Let it rest 5–10 minutes before serving to set.")
+        if "stir-fry" in title.lower():
+            tips.append("Tip: High heat and quick tossing preserve texture.")
+
+        recipe = {
+            "id": f"gen_{i+1}",
+            "name": title,
+            "ingredients": ", ".join(dict.fromkeys(full_ingredients)),  # unique order-preserving
+            "instructions": "\n".join(instructions) + ("\n\n" + " ".join(tips) if tips else ""),
+            "time": f"{est_time} mins",
+            "difficulty": det_diff,
+            "cuisine": cuisine,
+            "method": method,
+            "tags": f"{cuisine}, {method}, {dish_type}"
+        }
+        recipes.append(recipe)
+
+    return recipes
@@ -0,0 +1,45 @@
+# tests/test_metrics.py - process-wide totals and Prometheus rendering
+import copy
+
+from foodwise import metrics
+
+
+def finished_run(rerun_seconds, queries=1):
+    run = metrics.new_run_metrics()
+    run.update(rerun_seconds=rerun_seconds, finished_at=1000.0, queries=queries)
+    run["sections"]["tab_home"] = {"seconds": 0.01, "calls": 1}
+    run["db"]["fetch_orders"] = {"seconds": 0.002, "calls": 1, "rows": 3}
+    return run
+
+
+def test_reruns_accumulate_into_counters():
+    before = copy.deepcopy(metrics._totals)
+    metrics.accumulate(finished_run(0.03, queries=2))
+    metrics.accumulate(finished_run(0.3, queries=1))
+    after = metrics._totals
+
+    assert after["reruns"] - before["reruns"] == 2
+    assert after["queries"] - before["queries"] == 3
+    assert after["sections"]["tab_home"]["calls"] - before["sections"].get("tab_home", {"calls": 0})["calls"] == 2
+    assert after["db"]["fetch_orders"]["rows"] - before["db"].get("fetch_orders", {"rows": 0})["rows"] == 6
+    # histogram buckets are cumulative: the 0.03s rerun lands in every bucket, the 0.3s one from 0.5 up
+    bucket = dict(zip(metrics.RERUN_BUCKETS, range(len(metrics.RERUN_BUCKETS))))
+    assert after["rerun_buckets"][bucket[0.05]] - before["rerun_buckets"][bucket[0.05]] == 1
+    assert after["rerun_buckets"][bucket[0.5]] - before["rerun_buckets"][bucket[0.5]] == 2
+
+
+def test_render_prometheus_counters_and_histogram():
+    totals = {"reruns": 2, "queries": 5, "last_rerun_at": 1000.0,
+              "sections": {'odd"name': {"seconds": 0.5, "calls": 2}},
+              "db": {"fetch_orders": {"seconds": 0.1, "calls": 2, "rows": 7}},
+              "rerun_buckets": [1] + [2] * (len(metrics.RERUN_BUCKETS) - 1), "rerun_seconds_sum": 0.4}
+    text = metrics.render_prometheus(totals, first_rerun_seconds=0.2)
+
+    assert "# TYPE foodwise_reruns_total counter\nfoodwise_reruns_total 2\n" in text
+    assert "# TYPE foodwise_rerun_duration_seconds histogram" in text
+    assert 'foodwise_rerun_duration_seconds_bucket{le="+Inf"} 2' in text
+    assert "foodwise_rerun_duration_seconds_count 2" in text
+    assert 'foodwise_section_calls_total{section="odd\\"name"} 2' in text
+    assert 'foodwise_db_rows_total{call="fetch_orders"} 7' in text
+    assert "foodwise_first_rerun_seconds 0.2" in text
+    assert text.endswith("\n")
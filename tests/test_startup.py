@@ -0,0 +1,45 @@
+# tests/test_startup.py - cold-start guard for the foodwise package
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Overhead of importing the foodwise modules on top of `import streamlit` in the same fresh
+# interpreter. Measured at ~10ms; an eager pandas import alone adds several hundred.
+OVERHEAD_BUDGET = float(os.environ.get("FOODWISE_IMPORT_OVERHEAD_BUDGET", "0.05"))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+baseline = time.perf_counter()
+import foodwise.tabs, foodwise.layout, foodwise.db
+print(json.dumps({
+    "streamlit_seconds": baseline - start,
+    "overhead_seconds": time.perf_counter() - baseline,
+    "pandas": "pandas" in sys.modules,
+    "cProfile": "cProfile" in sys.modules,
+}))
+"""
+
+
+def run_cold_import():
+    # a fresh interpreter, so nothing is already cached in sys.modules
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_cold_import_skips_heavy_modules():
+    result = run_cold_import()
+    assert not result["pandas"], "pandas must only be imported when the planner/waste tabs need it"
+    assert not result["cProfile"], "cProfile must only be imported when a capture is requested"
+
+
+def test_cold_import_overhead_within_budget():
+    # best of three, so a single scheduler hiccup on a busy machine does not fail the run
+    overhead = min(run_cold_import()["overhead_seconds"] for _ in range(3))
+    assert overhead < OVERHEAD_BUDGET, (
+        f"foodwise imports add {overhead * 1000:.0f}ms on top of streamlit (budget {OVERHEAD_BUDGET * 1000:.0f}ms)"
+    )